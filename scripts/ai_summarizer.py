@@ -6,7 +6,6 @@ Uses Claude API to summarize and clean PDF content
 
 import os
 from typing import List, Dict, Optional
-from anthropic import Anthropic
 
 
 class AISummarizer:
@@ -24,10 +23,18 @@ class AISummarizer:
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY environment variable not set")
 
-        self.client = Anthropic(api_key=self.api_key)
+        self._client = None
         self.summary_level = summary_level
         self.model = "claude-sonnet-4-5-20250929"
 
+    @property
+    def client(self):
+        """Anthropic client, created on first use (the SDK is slow to import)"""
+        if self._client is None:
+            from anthropic import Anthropic
+            self._client = Anthropic(api_key=self.api_key)
+        return self._client
+
     def get_summary_prompt(self, level: str) -> str:
         """Get the appropriate prompt based on summary level"""
         prompts = {
@@ -151,6 +158,8 @@ Return only the formatted HTML, no preamble or explanation."""
             print(f"Processing section {i}/{total}: {section['title']}")
 
             processed_section = {
+                'index': section.get('index', i),
+                'anchor': section.get('anchor'),
                 'title': section['title'],
                 'level': section['level'],
                 'content': self.clean_content(section['content'])
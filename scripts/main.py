@@ -6,15 +6,82 @@ Orchestrates PDF parsing, AI summarization, and HTML generation
 
 import argparse
 import os
+import re
 import sys
 from pathlib import Path
+from typing import Dict, List
 
-# Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+SCRIPTS_DIR = Path(__file__).parent
 
-from pdf_parser import parse_pdf
-from ai_summarizer import summarize_pdf_content
-from html_generator import generate_html
+# Add scripts directory to path
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+# Stage modules (and their pdfplumber / anthropic / jinja2 dependencies) are
+# imported inside main() only when that stage runs, keeping --help and
+# --skip-summary startup cheap.
+
+
+def parse_importtime(output: str) -> List[Dict]:
+    """
+    Parse ``python -X importtime`` output
+
+    Args:
+        output: stderr of an interpreter run with ``-X importtime``
+
+    Returns:
+        One entry per imported module, in import order, with its cumulative
+        time in microseconds and whether it is a top-level import
+    """
+    entries = []
+    for line in output.splitlines():
+        match = re.match(r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)', line)
+        if match:
+            entries.append({
+                'module': match.group(4),
+                'cumulative_us': int(match.group(2)),
+                'top_level': not match.group(3)
+            })
+    return entries
+
+
+def _run_importtime(code: str) -> List[Dict]:
+    """Run code in a fresh interpreter with -X importtime and parse the result"""
+    import subprocess
+
+    cmd = [sys.executable, '-X', 'importtime', '-c', code]
+    result = subprocess.run(cmd, cwd=str(SCRIPTS_DIR), capture_output=True, text=True)
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"Import failed with exit code {result.returncode}")
+    return parse_importtime(result.stderr)
+
+
+def import_time_report(modules: List[str], top: int = 10) -> Dict:
+    """
+    Measure import cost of the given modules in a fresh interpreter
+
+    Imports that a bare interpreter already performs at startup (site,
+    encodings, ...) are subtracted, so the total covers only these modules.
+
+    Args:
+        modules: Module names to import (resolved from the scripts directory)
+        top: Number of most expensive imports to return
+
+    Returns:
+        Dictionary with total import time and the slowest packages, in microseconds
+    """
+    baseline = {entry['module'] for entry in _run_importtime('pass')}
+    entries = [
+        entry for entry in _run_importtime(f"import {', '.join(modules)}")
+        # Nested imports are already included in their top-level parent
+        if entry['top_level'] and entry['module'] not in baseline
+    ]
+
+    entries.sort(key=lambda e: e['cumulative_us'], reverse=True)
+    return {
+        'total_us': sum(entry['cumulative_us'] for entry in entries),
+        'imports': entries[:top]
+    }
 
 
 def main():
@@ -28,10 +95,12 @@ Examples:
   %(prog)s document.pdf
   %(prog)s report.pdf --output summary.html --summary-level detailed
   %(prog)s paper.pdf --skip-summary --dark-mode
+  %(prog)s manual.pdf --pages 120-180 --sections "Installation,Configuration"
         """
     )
 
-    parser.add_argument('pdf_file', help='Path to PDF file')
+    parser.add_argument('pdf_file', nargs='?',
+                        help='Path to PDF file (required unless --import-report is given)')
     parser.add_argument('--output', '-o', help='Output HTML file (default: same as PDF name)')
     parser.add_argument('--summary-level', choices=['brief', 'balanced', 'detailed'],
                         default='balanced', help='Level of AI summarization (default: balanced)')
@@ -42,9 +111,41 @@ Examples:
     parser.add_argument('--no-search', action='store_true',
                         help='Disable search functionality')
     parser.add_argument('--title', help='Custom page title (default: PDF filename)')
+    parser.add_argument('--pages',
+                        help='Only process these pages, e.g. "1-3,7,10-12" or "120-" to the end (default: all)')
+    parser.add_argument('--sections',
+                        help='Only process sections matching these indices or title patterns, '
+                             'e.g. "3-5" or "Installation,Appendix" (default: all). '
+                             'Indices count within the --pages slice; patterns cannot contain commas')
+    parser.add_argument('--import-report', action='store_true',
+                        help='Report import time of the stages this run would load, then exit')
+    parser.add_argument('--startup-budget', type=float, metavar='MS',
+                        help='With --import-report, exit with an error if imports exceed MS milliseconds')
 
     args = parser.parse_args()
 
+    if args.import_report:
+        # ai_summarizer defers the anthropic import until the client is used
+        modules = ['main', 'pdf_parser', 'html_generator']
+        if not args.skip_summary:
+            modules[2:2] = ['ai_summarizer', 'anthropic']
+        try:
+            report = import_time_report(modules)
+        except RuntimeError as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+        total_ms = report['total_us'] / 1000
+        print(f"⏱️  Import time for {', '.join(modules)}: {total_ms:.1f} ms")
+        for entry in report['imports']:
+            print(f"   {entry['cumulative_us'] / 1000:8.1f} ms  {entry['module']}")
+        if args.startup_budget is not None and total_ms > args.startup_budget:
+            print(f"\n❌ Startup budget exceeded: {total_ms:.1f} ms > {args.startup_budget:.1f} ms")
+            sys.exit(1)
+        return
+
+    if not args.pdf_file:
+        parser.error('pdf_file is required unless --import-report is given')
+
     # Validate PDF file exists
     pdf_path = Path(args.pdf_file)
     if not pdf_path.exists():
@@ -67,8 +168,10 @@ Examples:
     try:
         # Step 1: Parse PDF
         print("📖 Step 1/3: Parsing PDF...")
-        pdf_data = parse_pdf(str(pdf_path))
-        print(f"   ✓ Found {len(pdf_data['sections'])} sections across {pdf_data['metadata']['pages']} pages")
+        from pdf_parser import parse_pdf
+        pdf_data = parse_pdf(str(pdf_path), pages=args.pages, sections=args.sections)
+        print(f"   ✓ Found {len(pdf_data['sections'])} sections across "
+              f"{pdf_data['metadata']['parsed_pages']} of {pdf_data['metadata']['pages']} pages")
 
         # Step 2: AI Processing (optional)
         if args.skip_summary:
@@ -87,6 +190,7 @@ Examples:
                 print("   Or use --skip-summary to skip AI processing")
                 sys.exit(1)
 
+            from ai_summarizer import summarize_pdf_content
             result = summarize_pdf_content(
                 pdf_data['sections'],
                 summary_level=args.summary_level,
@@ -97,6 +201,7 @@ Examples:
 
         # Step 3: Generate HTML
         print("🎨 Step 3/3: Generating interactive HTML...")
+        from html_generator import generate_html
         output_file = generate_html(
             sections=processed_sections,
             title=title,
@@ -6,31 +6,213 @@ Extracts text and structure from PDF documents
 
 import pdfplumber
 import re
-from typing import List, Dict, Optional
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdftypes import resolve1
+from itertools import islice
+from pdfplumber.page import Page
+from typing import List, Dict, Optional, Tuple
+
+
+# A (start, end) pair of 1-based numbers; end is None for open-ended ranges like "120-"
+Range = Tuple[int, Optional[int]]
+
+
+def _parse_range(part: str) -> Optional[Range]:
+    """Parse "7", "3-5" or "120-" into a range, or return None if it is neither"""
+    match = re.match(r'^(\d+)\s*-\s*(\d*)$', part)
+    if match:
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else None
+    elif part.isdigit():
+        start = end = int(part)
+    else:
+        return None
+
+    if start < 1 or (end is not None and end < start):
+        raise ValueError(f"Invalid range: '{part}'")
+    return start, end
+
+
+def _in_ranges(number: int, ranges: List[Range]) -> bool:
+    """Check whether a number falls inside any of the ranges"""
+    return any(start <= number and (end is None or number <= end) for start, end in ranges)
+
+
+def _format_range(start: int, end: Optional[int]) -> str:
+    if end is None:
+        return f"{start}-"
+    return str(start) if start == end else f"{start}-{end}"
+
+
+def parse_page_range(spec: str) -> List[Range]:
+    """
+    Parse a page selector such as "1-3,7,10-12" or "120-" into page ranges
+
+    Args:
+        spec: Comma-separated page numbers and inclusive ranges; a range
+              without an end ("120-") runs to the last page
+
+    Returns:
+        Sorted, merged list of (start, end) pairs, end None meaning "to the end"
+    """
+    ranges = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        page_range = _parse_range(part)
+        if page_range is None:
+            raise ValueError(f"Invalid page selector: '{part}'")
+        ranges.append(page_range)
+
+    if not ranges:
+        raise ValueError(f"Empty page selector: '{spec}'")
+
+    # Merge overlapping and adjacent ranges
+    merged = []
+    for start, end in sorted(ranges):
+        if merged:
+            last_start, last_end = merged[-1]
+            if last_end is None or start <= last_end + 1:
+                if last_end is not None and (end is None or end > last_end):
+                    merged[-1] = (last_start, end)
+                continue
+        merged.append((start, end))
+    return merged
+
+
+def select_sections(sections: List[Dict], spec: str) -> List[Dict]:
+    """
+    Select a subset of sections by index or title pattern
+
+    Indices follow the order of the parsed sections, so when only part of
+    the document was parsed (see PDFParser page_ranges) they are relative
+    to that slice. Each section's 'anchor' stays stable either way.
+
+    Args:
+        sections: Sections from PDFParser.parse_structure
+        spec: Comma-separated section indices, index ranges ("3-5", "8-"),
+              or case-insensitive title patterns (regular expressions,
+              which therefore cannot contain commas)
+
+    Returns:
+        Selected sections in document order, keeping their original index
+    """
+    ranges = []
+    patterns = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        index_range = _parse_range(part)
+        if index_range is not None:
+            ranges.append(index_range)
+        else:
+            try:
+                patterns.append(re.compile(part, re.IGNORECASE))
+            except re.error as e:
+                raise ValueError(f"Invalid section pattern '{part}': {e}")
+
+    return [
+        section for section in sections
+        if _in_ranges(section['index'], ranges)
+        or any(pattern.search(section['title']) for pattern in patterns)
+    ]
 
 
 class PDFParser:
     """Extract text and structure from PDF files"""
 
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, page_ranges: Optional[List[Range]] = None):
+        """
+        Initialize the parser
+
+        Args:
+            pdf_path: Path to the PDF file
+            page_ranges: Optional page ranges (see parse_page_range) to restrict parsing to
+        """
         self.pdf_path = pdf_path
+        self.page_ranges = page_ranges
+        self.metadata = None
         self.pages = []
         self.sections = []
 
     def extract_text(self) -> List[Dict]:
-        """Extract text from all pages"""
-        with pdfplumber.open(self.pdf_path) as pdf:
-            for i, page in enumerate(pdf.pages):
+        """
+        Extract text from all pages, or only the selected ones
+
+        The page tree is only walked up to the last selected page, and Page
+        objects are only built for selected pages.
+        """
+        # PDF.close() builds every page through pdf.pages, so the stream is
+        # managed here and only the pages built below are closed
+        with open(self.pdf_path, 'rb') as stream:
+            pdf = pdfplumber.PDF(stream, stream_is_external=True)
+            total_pages = self._count_pages(pdf)
+            page_numbers = self._select_pages(total_pages)
+
+            parsed_pages = 0
+            doctop = 0
+            last_page = max(page_numbers) if page_numbers is not None else None
+            pdf_pages = islice(PDFPage.create_pages(pdf.doc), last_page)
+            for page_number, pdf_page in enumerate(pdf_pages, 1):
+                if page_numbers is not None and page_number not in page_numbers:
+                    continue
+                page = Page(pdf, pdf_page, page_number=page_number, initial_doctop=doctop)
+                doctop += page.height
+                parsed_pages += 1
+
                 text = page.extract_text()
                 if text:
                     self.pages.append({
-                        'page_number': i + 1,
+                        'page_number': page_number,
                         'text': text,
                         'width': page.width,
                         'height': page.height
                     })
+                page.close()
+
+            self.metadata = {
+                'pages': total_pages,
+                'parsed_pages': parsed_pages,
+                'metadata': pdf.metadata
+            }
         return self.pages
 
+    def _select_pages(self, total_pages: int) -> Optional[set]:
+        """
+        Resolve the page ranges against the document's page count
+
+        Returns:
+            Set of existing page numbers to parse, or None for all pages
+        """
+        if not self.page_ranges:
+            return None
+
+        page_numbers = set()
+        missing = []
+        for start, end in self.page_ranges:
+            if start > total_pages:
+                missing.append(_format_range(start, end))
+                continue
+            if end is not None and end > total_pages:
+                missing.append(_format_range(total_pages + 1, end))
+            page_numbers.update(range(start, min(end or total_pages, total_pages) + 1))
+
+        if not page_numbers:
+            raise ValueError(f"No requested page exists (document has {total_pages} pages)")
+        if missing:
+            print(f"Warning: Ignoring pages beyond page {total_pages}: {', '.join(missing)}")
+        return page_numbers
+
+    @staticmethod
+    def _count_pages(pdf) -> int:
+        """Read the page count from the page tree without loading every page"""
+        try:
+            return int(resolve1(pdf.doc.catalog['Pages'])['Count'])
+        except (KeyError, TypeError, ValueError):
+            return sum(1 for _ in PDFPage.create_pages(pdf.doc))
+
     def detect_headings(self, text: str) -> List[Dict]:
         """
         Detect headings in text based on common patterns:
@@ -88,7 +270,10 @@ class PDFParser:
 
         if not headings:
             # No headings found, treat entire document as one section
+            first_page = self.pages[0]['page_number'] if self.pages else 1
             return [{
+                'index': 1,
+                'anchor': f"section-p{first_page}-1",
                 'title': 'Document Content',
                 'level': 1,
                 'content': full_text
@@ -98,6 +283,12 @@ class PDFParser:
         lines = full_text.split('\n')
         sections = []
 
+        # Source page of every line, so anchors don't depend on the parsed slice
+        line_pages = []
+        for page in self.pages:
+            line_pages.extend([page['page_number']] * len(page['text'].split('\n')))
+        page_ordinals = {}
+
         for i, heading in enumerate(headings):
             start_line = heading['line_number']
             end_line = headings[i + 1]['line_number'] if i + 1 < len(headings) else len(lines)
@@ -106,7 +297,12 @@ class PDFParser:
             content_lines = lines[start_line + 1:end_line]
             content = '\n'.join(content_lines).strip()
 
+            page_number = line_pages[start_line]
+            page_ordinals[page_number] = page_ordinals.get(page_number, 0) + 1
+
             sections.append({
+                'index': i + 1,
+                'anchor': f"section-p{page_number}-{page_ordinals[page_number]}",
                 'title': heading['text'],
                 'level': heading['level'],
                 'content': content
@@ -116,10 +312,16 @@ class PDFParser:
         return sections
 
     def get_metadata(self) -> Dict:
-        """Extract PDF metadata"""
-        with pdfplumber.open(self.pdf_path) as pdf:
+        """Extract PDF metadata (collected by extract_text when it has run)"""
+        if self.metadata is not None:
+            return self.metadata
+
+        with open(self.pdf_path, 'rb') as stream:
+            pdf = pdfplumber.PDF(stream, stream_is_external=True)
+            total_pages = self._count_pages(pdf)
             return {
-                'pages': len(pdf.pages),
+                'pages': total_pages,
+                'parsed_pages': len(self._select_pages(total_pages) or range(total_pages)),
                 'metadata': pdf.metadata
             }
 
@@ -132,25 +334,36 @@ class PDFParser:
         return []
 
 
-def parse_pdf(pdf_path: str) -> Dict:
+def parse_pdf(pdf_path: str, pages: Optional[str] = None,
+              sections: Optional[str] = None) -> Dict:
     """
     Main function to parse a PDF and return structured data
 
     Args:
         pdf_path: Path to the PDF file
+        pages: Optional page selector, e.g. "120-180,200" or "120-"
+        sections: Optional section selector by index or title pattern,
+                  e.g. "3-5" or "Installation,Appendix"
 
     Returns:
         Dictionary with sections, metadata, and raw text
     """
-    parser = PDFParser(pdf_path)
+    page_ranges = parse_page_range(pages) if pages else None
+    parser = PDFParser(pdf_path, page_ranges=page_ranges)
 
     # Extract and parse
     parser.extract_text()
-    sections = parser.parse_structure()
+    all_sections = parser.parse_structure()
     metadata = parser.get_metadata()
 
+    selected = all_sections
+    if sections:
+        selected = select_sections(all_sections, sections)
+        if not selected:
+            raise ValueError(f"No sections match selector: '{sections}'")
+
     return {
-        'sections': sections,
+        'sections': selected,
         'metadata': metadata,
         'pages': parser.pages
     }
@@ -171,6 +384,6 @@ if __name__ == '__main__':
     print(f"Sections: {len(result['sections'])}")
     print(f"\n=== Sections ===")
 
-    for i, section in enumerate(result['sections'], 1):
-        print(f"\n{i}. {section['title']} (Level {section['level']})")
+    for section in result['sections']:
+        print(f"\n{section['index']}. {section['title']} (Level {section['level']})")
         print(f"   Content length: {len(section['content'])} characters")
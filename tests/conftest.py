@@ -0,0 +1,56 @@
+"""
+Shared test fixtures
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).parent.parent / 'scripts'
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+def build_pdf(page_lines):
+    """Build a minimal text PDF with one list of lines per page"""
+    page_count = len(page_lines)
+    font_id = 3 + 2 * page_count
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        ("<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            ' '.join(f"{3 + 2 * i} 0 R" for i in range(page_count)), page_count)).encode(),
+    ]
+
+    for i, lines in enumerate(page_lines):
+        stream = "BT /F1 12 Tf 72 720 Td 16 TL " + ' '.join(
+            f"({line}) Tj T*" for line in lines) + " ET"
+        objects.append((
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + 2 * i} 0 R >>"
+        ).encode())
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream".encode())
+
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+@pytest.fixture
+def chapters_pdf(tmp_path):
+    """A 10-page PDF with one chapter heading per page"""
+    path = tmp_path / 'chapters.pdf'
+    path.write_bytes(build_pdf([
+        [f"CHAPTER {n}", f"Body text of chapter {n}."] for n in range(1, 11)
+    ]))
+    return path
@@ -0,0 +1,123 @@
+"""
+Tests for page and section selection in pdf_parser
+"""
+
+import pytest
+
+pytest.importorskip('pdfplumber')
+
+from pdf_parser import parse_page_range, parse_pdf, select_sections
+
+
+SECTIONS = [
+    {'index': i, 'anchor': f"section-p{i}-1", 'title': title}
+    for i, title in enumerate(['Introduction', 'Installation Guide', 'Configuration', 'Appendix A'], 1)
+]
+
+
+class TestParsePageRange:
+
+    def test_ranges_and_single_pages(self):
+        assert parse_page_range("1-3,7,10-12") == [(1, 3), (7, 7), (10, 12)]
+
+    def test_dedupes_and_sorts(self):
+        assert parse_page_range("5, 3-5 ,4") == [(3, 5)]
+
+    def test_open_ended_ranges(self):
+        assert parse_page_range("120-") == [(120, None)]
+        assert parse_page_range("200,3,120-") == [(3, 3), (120, None)]
+
+    def test_merges_adjacent_ranges(self):
+        assert parse_page_range("1-3,4-6,8") == [(1, 6), (8, 8)]
+
+    @pytest.mark.parametrize('spec', ['', ',', 'abc', '0', '5-3', '0-', '2-x', '-5'])
+    def test_invalid_specs(self, spec):
+        with pytest.raises(ValueError):
+            parse_page_range(spec)
+
+
+class TestSelectSections:
+
+    def test_indices_and_ranges(self):
+        selected = select_sections(SECTIONS, "1,3-4")
+        assert [s['index'] for s in selected] == [1, 3, 4]
+
+    def test_title_patterns_are_case_insensitive(self):
+        selected = select_sections(SECTIONS, "install,^appendix")
+        assert [s['title'] for s in selected] == ['Installation Guide', 'Appendix A']
+
+    def test_mixed_indices_and_patterns_keep_document_order(self):
+        selected = select_sections(SECTIONS, "Config,1")
+        assert [s['index'] for s in selected] == [1, 3]
+
+    def test_open_ended_and_huge_ranges(self):
+        assert [s['index'] for s in select_sections(SECTIONS, "3-")] == [3, 4]
+        assert len(select_sections(SECTIONS, "1-999999999")) == 4
+
+    @pytest.mark.parametrize('spec', ['5-3', '0-2', '(unclosed'])
+    def test_invalid_specs(self, spec):
+        with pytest.raises(ValueError):
+            select_sections(SECTIONS, spec)
+
+
+class TestParsePdf:
+
+    def test_sections_keep_index_and_anchor(self, chapters_pdf):
+        result = parse_pdf(str(chapters_pdf), sections="2,CHAPTER 7")
+        assert [(s['index'], s['anchor'], s['title']) for s in result['sections']] == [
+            (2, 'section-p2-1', 'CHAPTER 2'),
+            (7, 'section-p7-1', 'CHAPTER 7'),
+        ]
+
+    def test_anchors_are_stable_across_page_slices(self, chapters_pdf):
+        result = parse_pdf(str(chapters_pdf), pages="3-5", sections="2")
+        assert [(s['index'], s['anchor'], s['title']) for s in result['sections']] == [
+            (2, 'section-p4-1', 'CHAPTER 4'),
+        ]
+        assert result['metadata']['pages'] == 10
+        assert result['metadata']['parsed_pages'] == 3
+
+    def test_out_of_range_pages_are_rejected(self, chapters_pdf):
+        with pytest.raises(ValueError, match="No requested page exists"):
+            parse_pdf(str(chapters_pdf), pages="50")
+
+    def test_partially_out_of_range_pages_warn(self, chapters_pdf, capsys):
+        result = parse_pdf(str(chapters_pdf), pages="9-12")
+        assert [s['title'] for s in result['sections']] == ['CHAPTER 9', 'CHAPTER 10']
+        assert "Ignoring pages beyond page 10: 11-12" in capsys.readouterr().out
+
+    def test_huge_ranges_are_clamped_to_the_document(self, chapters_pdf, capsys):
+        result = parse_pdf(str(chapters_pdf), pages="5-200000,300000")
+        assert result['metadata']['parsed_pages'] == 6
+        out = capsys.readouterr().out
+        assert "Ignoring pages beyond page 10: 11-200000, 300000" in out
+
+    def test_open_ended_pages_run_to_the_end(self, chapters_pdf, capsys):
+        result = parse_pdf(str(chapters_pdf), pages="8-")
+        assert [s['title'] for s in result['sections']] == ['CHAPTER 8', 'CHAPTER 9', 'CHAPTER 10']
+        assert "Warning" not in capsys.readouterr().out
+
+    def test_page_tree_is_not_walked_past_the_last_selected_page(self, chapters_pdf, monkeypatch):
+        import pdf_parser
+
+        walked = []
+        create_pages = pdf_parser.PDFPage.create_pages
+
+        def tracking_create_pages(doc):
+            for page in create_pages(doc):
+                walked.append(page)
+                yield page
+
+        monkeypatch.setattr(pdf_parser.PDFPage, 'create_pages', tracking_create_pages)
+        result = parse_pdf(str(chapters_pdf), pages="2-3")
+        assert [p['page_number'] for p in result['pages']] == [2, 3]
+        assert len(walked) == 3
+
+    def test_page_count_without_count_entry(self, tmp_path):
+        from conftest import build_pdf
+
+        path = tmp_path / 'no_count.pdf'
+        # Same length keeps the xref offsets valid
+        path.write_bytes(build_pdf([["CHAPTER 1"], ["CHAPTER 2"]]).replace(b"/Count", b"/Cxxxx"))
+        result = parse_pdf(str(path))
+        assert result['metadata']['pages'] == 2
@@ -0,0 +1,83 @@
+"""
+Startup regression tests for the CLI entry point
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip('pdfplumber')
+pytest.importorskip('jinja2')
+
+from conftest import SCRIPTS_DIR
+from main import import_time_report, parse_importtime
+
+MAIN = str(SCRIPTS_DIR / 'main.py')
+
+HEAVY_MODULES = ('anthropic', 'pdfplumber', 'jinja2')
+
+# Import time main.py may add on top of bare interpreter startup for --help
+STARTUP_BUDGET_MS = 100
+
+# Import time of everything a --skip-summary conversion loads (main, pdf_parser
+# with pdfplumber, html_generator with jinja2); about 200 ms on a typical machine
+SKIP_SUMMARY_BUDGET_MS = 400
+
+
+def importtime(*args):
+    """Run a Python command with -X importtime and return its exit code and imports"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', *args],
+                            capture_output=True, text=True)
+    return result.returncode, parse_importtime(result.stderr)
+
+
+def imported_packages(entries):
+    return {entry['module'].split('.')[0] for entry in entries}
+
+
+def test_heavy_dependencies_are_not_imported_at_startup(chapters_pdf, tmp_path):
+    returncode, entries = importtime(MAIN, '--help')
+    assert returncode == 0
+    assert not imported_packages(entries) & set(HEAVY_MODULES)
+
+    # A --skip-summary conversion needs pdfplumber and jinja2, but never the SDK
+    output = tmp_path / 'out.html'
+    returncode, entries = importtime(MAIN, str(chapters_pdf), '--skip-summary',
+                                     '--output', str(output))
+    assert returncode == 0
+    assert output.exists()
+    assert {'pdfplumber', 'jinja2'} <= imported_packages(entries)
+    assert 'anthropic' not in imported_packages(entries)
+
+
+def test_startup_stays_within_budget():
+    _, baseline_entries = importtime('-c', 'pass')
+    baseline = {entry['module'] for entry in baseline_entries}
+
+    # Best of three to keep the check stable on noisy machines
+    totals = []
+    for _ in range(3):
+        returncode, entries = importtime(MAIN, '--help')
+        assert returncode == 0
+        totals.append(sum(
+            entry['cumulative_us'] for entry in entries
+            if entry['top_level'] and entry['module'] not in baseline
+        ) / 1000)
+
+    assert min(totals) < STARTUP_BUDGET_MS
+
+
+def test_skip_summary_imports_stay_within_budget():
+    totals = [
+        import_time_report(['main', 'pdf_parser', 'html_generator'])['total_us'] / 1000
+        for _ in range(3)
+    ]
+    assert min(totals) < SKIP_SUMMARY_BUDGET_MS
+
+
+def test_import_time_report_excludes_interpreter_startup():
+    report = import_time_report(['json'])
+    modules = [entry['module'] for entry in report['imports']]
+    assert modules == ['json']
+    assert report['total_us'] == report['imports'][0]['cumulative_us']